@@ -0,0 +1,194 @@
+"""
+Mimic `select`-type behavior over a set of asynchronous iterators
+"""
+import asyncio
+from collections import deque
+
+from selector import Selector
+
+
+class AsyncSelector(Selector):
+    """
+    'Select' inputs from a collection of asynchronous iterators. All of the
+    iterators are awaited at once, and values are taken in the order they
+    arrive, so slow iterators don't hold up the others.
+    """
+    __slots__ = ('_changes',)
+
+    def __init__(self, stop_condition, pause_condition=None, gens=None,
+                 memoize=False):
+        """
+        :param stop_condition: a predicate that should return `True` when an
+        iterator should be stopped
+        :type stop_condition: function (predicate)
+        :param pause_condition: a predicate that should return `True` when a
+        value should be skipped without stopping the iterator it came from.
+        Since every iterator is already being awaited, there's no other
+        iterator to switch to. Defaults to `Selector.false`
+        :type pause_condition: function (predicate)
+        NB: the functions passed to `stop_condition` and `pause_condition`
+            should each take a single argument and return a boolean.
+        :param gens: list of asynchronous iterators to add to the Selector
+        :type gens: list of asynchronous generator objects
+        :param memoize: cache the results of `stop_condition` and
+        `pause_condition`, so each is called only once per distinct value.
+        Only safe if both conditions are pure and every value is hashable
+        :type memoize: bool
+        """
+        # (added, iterator) pairs, logged only while `start()` is running
+        self._changes = None
+        super(AsyncSelector, self).__init__(stop_condition, pause_condition,
+                                            gens, memoize)
+
+    @staticmethod
+    def _check_gen(gen):
+        """
+        Make sure an asynchronous iterator can be awaited by `start()`
+        :param gen: the asynchronous iterator to check
+        :type gen: asynchronous generator object
+        :return: `gen`
+        """
+        if not hasattr(gen, '__anext__'):
+            raise TypeError('{!r} is not an asynchronous iterator'.format(gen))
+        return gen
+
+    # pylint: disable=invalid-overridden-method
+    async def start(self):
+        """
+        Start the selector
+        :return: asynchronous generator object
+        """
+        stop = self.stop_condition
+        pause = self.pause_condition
+        changes = self._changes = deque()
+        # task -> iterator, and id(iterator) -> task
+        pending = {}
+        running = {}
+
+        def schedule(gen):
+            task = asyncio.ensure_future(gen.__anext__())
+            pending[task] = gen
+            running[id(gen)] = task
+
+        def catch_up():
+            # apply the `add_gen`, `remove_gen` and `stop` calls made since
+            # the last check
+            while changes:
+                added, gen = changes.popleft()
+                task = running.get(id(gen))
+                if added:
+                    if task is None:
+                        schedule(gen)
+                elif task is not None:
+                    task.cancel()
+                    del pending[task]
+                    del running[id(gen)]
+
+        for gen in self.gens:
+            schedule(gen)
+        try:
+            while True:
+                catch_up()
+                if not pending:
+                    break
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    catch_up()
+                    gen = pending.pop(task, None)
+                    if gen is None:
+                        # removed after its value had arrived
+                        continue
+                    del running[id(gen)]
+                    try:
+                        res = task.result()
+                    except StopAsyncIteration:
+                        self._discard(gen)
+                        continue
+                    if stop(res):
+                        self._discard(gen)
+                        continue
+                    schedule(gen)
+                    if not pause(res):
+                        self.curr = gen
+                        yield res
+        finally:
+            self._changes = None
+            for task in pending:
+                task.cancel()
+            self.curr = None
+
+    def _discard(self, gen):
+        """
+        Remove a finished or stopped iterator, if it's still there
+        """
+        try:
+            self.gens.remove(gen)
+        except ValueError:
+            pass
+
+    # pylint: disable=invalid-overridden-method
+    async def drain(self, out=None):
+        """
+        Run the selector to completion, collecting its values
+        :param out: the list to append values to. Defaults to a new list
+        :type out: list
+        :return: `out`
+        """
+        if out is None:
+            out = []
+        async for res in self.start():
+            out.append(res)
+        return out
+
+    def add_gen(self, gen):
+        """
+        Add an asynchronous iterator, which is awaited straight away if the
+        selector is running
+        :param gen: the asynchronous iterator to add
+        :type gen: asynchronous generator object
+        """
+        super(AsyncSelector, self).add_gen(gen)
+        if self._changes is not None:
+            self._changes.append((True, gen))
+
+    def remove_gen(self, gen):
+        """
+        Remove an asynchronous iterator, which stops being awaited if the
+        selector is running
+        :param gen: the asynchronous iterator to remove
+        :type gen: asynchronous generator object
+        """
+        super(AsyncSelector, self).remove_gen(gen)
+        if self._changes is not None:
+            self._changes.append((False, gen))
+
+    def stop(self):
+        """
+        Stop the selector by resetting it to its original state
+        """
+        if self._changes is not None:
+            self._changes.extend((False, gen) for gen in self.gens)
+        super(AsyncSelector, self).stop()
+
+    def pause_gen(self):
+        """
+        Not supported: every iterator is awaited at once, so there's no
+        current one to pause
+        """
+        raise TypeError('AsyncSelector awaits every iterator at once and '
+                        'has none to pause')
+
+    def __iter__(self):
+        """
+        Not supported: use `async for` instead
+        """
+        raise TypeError("'AsyncSelector' object is not iterable, "
+                        "use 'async for' instead")
+
+    def __aiter__(self):
+        """
+        Allow selector to be iterated through with `async for`
+        :return: asynchronous generator object
+        """
+        return self.start()
@@ -1,16 +1,34 @@
 """
 Mimic `select`-type behavior over a set of generators
 """
-from itertools import cycle
+from collections import deque
+from itertools import chain, repeat
+from numbers import Integral
 from operator import itemgetter
 
+try:
+    from itertools import izip as zip  # pylint: disable=redefined-builtin
+except ImportError:
+    # Python 3
+    pass
+
+try:
+    from functools import lru_cache
+except ImportError:
+    # Python 2
+    lru_cache = None
+
 
 class Selector(object):
     """
     'Select' inputs from a collection of generators. Generators are paused or
     stopped based on user-defined conditions.
     """
-    def __init__(self, stop_condition, pause_condition=None, gens=None):
+    __slots__ = ('gens', 'curr', 'stop_condition', 'pause_condition', 'chunk',
+                 '__weakref__')
+
+    def __init__(self, stop_condition, pause_condition=None, gens=None,
+                 memoize=False, chunk=None):
         """
         :param stop_condition: a predicate that should return `True` when a
         generator should be stopped
@@ -25,12 +43,29 @@ class Selector(object):
             should each take a single argument and return a boolean.
         :param gens: list of generators to add to the Selector
         :type gens: list of generator objects
-        """
-        self.gens = gens or []
-        self.started = None
+        :param memoize: cache the results of `stop_condition` and
+        `pause_condition`, so each is called only once per distinct value.
+        Only safe if both conditions are pure and every value is hashable
+        :type memoize: bool
+        :param chunk: move on to the next generator after taking this many
+        values from the current one, even if it hasn't been paused. Defaults
+        to `None`, which only moves on from a generator once it's paused,
+        stopped or exhausted
+        :type chunk: int
+        """
+        if chunk is not None and (isinstance(chunk, bool) or
+                                  not isinstance(chunk, Integral) or
+                                  chunk < 1):
+            raise ValueError(
+                'chunk must be a positive int, not {!r}'.format(chunk))
+        self.gens = deque(self._check_gen(gen) for gen in gens or [])
         self.curr = None
         self.stop_condition = stop_condition
         self.pause_condition = pause_condition or self.false
+        self.chunk = chunk
+        if memoize:
+            self.stop_condition = self.memoized(self.stop_condition)
+            self.pause_condition = self.memoized(self.pause_condition)
 
     def add_gen(self, gen):
         """
@@ -38,7 +73,7 @@ class Selector(object):
         :param gen: the generator to add
         :type gen: generator object
         """
-        self.gens.append(gen)
+        self.gens.append(self._check_gen(gen))
 
     def add_gens(self, gens):
         """
@@ -49,47 +84,172 @@ class Selector(object):
         for gen in gens:
             self.add_gen(gen)
 
+    @staticmethod
+    def _check_gen(gen):
+        """
+        Make sure a generator is an iterator, so that bad input fails here
+        rather than mid-run. The selection loops run `for` over the current
+        generator every time it comes back around, so an iterable that isn't
+        its own iterator (a list, say) would start over each time
+        :param gen: the generator to check
+        :type gen: generator object
+        :return: `gen`
+        """
+        try:
+            is_iterator = iter(gen) is gen
+        except TypeError:
+            is_iterator = False
+        if not is_iterator:
+            raise TypeError('{!r} is not an iterator: selectors need '
+                            '`__iter__` returning the object itself as well '
+                            'as `next`'.format(gen))
+        return gen
+
     def start(self):
         """
         Start the selector
         :return: generator object
         """
-        self.started = cycle(self.gens)
-        self.curr = next(self.started)
-        while True:
-            try:
-                res = next(self.curr)
-            except StopIteration:
-                self.remove_gen(self.curr)
+        if self.chunk:
+            return self._select_chunked()
+        if self.pause_condition is not Selector.false:
+            return self._select()
+        if self.stop_condition is not Selector.false:
+            return self._select_unpaused()
+        return self._chain()
+
+    def _select(self):
+        """
+        Take values from the current generator until it's stopped, paused
+        or exhausted, then move on to the next one
+        """
+        stop = self.stop_condition
+        pause = self.pause_condition
+        while self.gens:
+            curr = self.curr = self.gens[0]
+            # `for` resumes `curr` through its tp_iternext slot directly,
+            # without the cost of calling the `next` builtin per value
+            for res in curr:
+                if stop(res):
+                    self.gens.popleft()
+                    break
+                if pause(res):
+                    self.gens.rotate(-1)
+                    break
+                yield res
+                # `remove_gen`, `pause_gen` and `stop` all move `.curr` on
+                if self.curr is not curr:
+                    break
             else:
-                if self.stop_condition(res):
-                    self.remove_gen(self.curr)
-                elif self.pause_condition(res):
-                    self.pause_gen()
-                else:
-                    yield res
+                self.gens.popleft()
+        self.curr = None
+
+    def _select_unpaused(self):
+        """
+        `._select` for selectors without a pause condition, which never
+        need to call it
+        """
+        stop = self.stop_condition
+        while self.gens:
+            curr = self.curr = self.gens[0]
+            for res in curr:
+                if stop(res):
+                    self.gens.popleft()
+                    break
+                yield res
+                if self.curr is not curr:
+                    break
+            else:
+                self.gens.popleft()
+        self.curr = None
+
+    def _select_chunked(self):
+        """
+        `._select` that also moves on to the next generator after every
+        `.chunk` values
+        """
+        stop = self.stop_condition
+        pause = self.pause_condition
+        chunk = self.chunk
+        while self.gens:
+            curr = self.curr = self.gens[0]
+            taken = 0
+            for res in curr:
+                if stop(res):
+                    self.gens.popleft()
+                    break
+                if pause(res):
+                    self.gens.rotate(-1)
+                    break
+                yield res
+                if self.curr is not curr:
+                    break
+                taken += 1
+                if taken == chunk:
+                    self.gens.rotate(-1)
+                    break
+            else:
+                self.gens.popleft()
+        self.curr = None
+
+    def drain(self, out=None):
+        """
+        Run the selector to completion, collecting its values
+        :param out: the list to append values to. Defaults to a new list
+        :type out: list
+        :return: `out`
+        """
+        if out is None:
+            out = []
+        out.extend(self.start())
+        return out
+
+    def _chain(self):
+        """
+        Exhaust each generator in turn. With no stop or pause condition there
+        is nothing to check per value, so `itertools.chain` does the work.
+        `chain` holds on to the current generator until it's exhausted, so
+        `remove_gen`, `pause_gen` and `stop` only take effect after that
+        """
+        return chain.from_iterable(self._fronts())
+
+    def _fronts(self):
+        """
+        Yield the current generator, removing it once it's been exhausted
+        """
+        while self.gens:
+            curr = self.curr = self.gens[0]
+            yield curr
+            if self.gens and self.gens[0] is curr:
+                self.gens.popleft()
+        self.curr = None
 
     def stop(self):
         """
         Stop the selector by resetting it to its original state
         """
-        self.started = None
-        self.gens = []
+        self.gens = deque()
         self.curr = None
 
     def pause_gen(self):
         """
         Start taking values from the next generator
         """
-        self.curr = next(self.started)
+        self.gens.rotate(-1)
+        self.curr = self.gens[0]
 
     def remove_gen(self, gen):
         """
-        Remove a generator from the selector and re-initialize self.started
+        Remove a generator from the selector and move on to the next one.
+        Removing the current generator is O(1); any other is O(N)
+        :param gen: the generator object to remove
+        :type gen: a generator object
         """
-        self.gens.remove(gen)
-        self.started = cycle(self.gens)
-        self.curr = next(self.started)
+        if self.gens and self.gens[0] is gen:
+            self.gens.popleft()
+        else:
+            self.gens.remove(gen)
+        self.curr = self.gens[0] if self.gens else None
 
     def __iter__(self):
         """
@@ -100,10 +260,13 @@ class Selector(object):
 
     def __getitem__(self, idx):
         """
-        Access an individual generator
+        Access an individual generator, or a list of them
         :param idx: index of the generator to be accessed
-        :type idx: int
+        :type idx: int or slice
         """
+        if isinstance(idx, slice):
+            # deques don't support slicing
+            return list(self.gens)[idx]
         return self.gens[idx]
 
     def __repr__(self):
@@ -120,8 +283,9 @@ class Selector(object):
         """
         # pylint: disable=missing-docstring
         def wrapper(*args, **kwargs):
-            self.add_gen(gen(*args, **kwargs))
-            return gen(*args, **kwargs)
+            instance = gen(*args, **kwargs)
+            self.add_gen(instance)
+            return instance
         # TODO: doc assignment doesn't seem to be working
         wrapper.__doc__ = gen.__doc__
         wrapper.__name__ = gen.__name__
@@ -137,12 +301,46 @@ class Selector(object):
         """
         return False
 
+    @staticmethod
+    def memoized(pred, maxsize=1024):
+        """
+        Cache the results of a pure predicate. `Selector.false` and
+        predicates that are already `functools.lru_cache` wrappers are
+        returned as-is
+        :param pred: the predicate to cache
+        :type pred: function (predicate)
+        :param maxsize: the most results to keep
+        :type maxsize: int
+        """
+        if pred is Selector.false or hasattr(pred, 'cache_info'):
+            return pred
+        # values that compare equal but differ in type (`1`, `1.0` and
+        # `True`) can get different answers, so they're cached separately
+        if lru_cache is not None:
+            return lru_cache(maxsize=maxsize, typed=True)(pred)
+        cache = {}
+
+        # pylint: disable=missing-docstring
+        def wrapper(val):
+            key = (type(val), val)
+            try:
+                return cache[key]
+            except KeyError:
+                res = pred(val)
+                if len(cache) < maxsize:
+                    cache[key] = res
+                return res
+        return wrapper
+
 
 class LabeledSelector(Selector):
     """
     Subclass of Selector that allows outputs to be labeled by origin
     """
-    def __init__(self, stop_condition, pause_condition=None, gen_dict=None):
+    __slots__ = ('labels', 'emit', '_gens_dict_cache', '_labels_dict_cache')
+
+    def __init__(self, stop_condition, pause_condition=None, gen_dict=None,
+                 memoize=False, chunk=None, emit='dict'):
         """
         :param stop_condition: a predicate that should return `True` when a
         generator should be stopped
@@ -157,43 +355,194 @@ class LabeledSelector(Selector):
             should each take a single argument and return a boolean.
         :param gen_dict: a dict of labeled generators to add to the Selector
         :param gen_dict: dict ({'label': <generator>})
-        """
-        super(LabeledSelector, self).__init__(stop_condition, pause_condition)
-        self.labels = []
+        :param memoize: cache the results of `stop_condition` and
+        `pause_condition`, so each is called only once per distinct value.
+        Only safe if both conditions are pure and every value is hashable
+        :type memoize: bool
+        :param chunk: move on to the next generator after taking this many
+        values from the current one, even if it hasn't been paused. Defaults
+        to `None`, which only moves on from a generator once it's paused,
+        stopped or exhausted
+        :type chunk: int
+        :param emit: how to label values: `'dict'` yields `{label: value}`,
+        `'tuple'` yields the cheaper `(label, value)`. Defaults to `'dict'`
+        :type emit: str
+        """
+        if emit not in ('dict', 'tuple'):
+            raise ValueError(
+                "emit must be 'dict' or 'tuple', not {!r}".format(emit))
+        super(LabeledSelector, self).__init__(stop_condition, pause_condition,
+                                              memoize=memoize, chunk=chunk)
+        self.labels = deque()
+        self.emit = emit
+        self._gens_dict_cache = None
+        self._labels_dict_cache = None
         if gen_dict:
             self.add_gens(gen_dict)
 
     @property
     def gens_dict(self):
         """
-        A dictionary mapping generators to labels
+        A dictionary mapping generators to labels, built on first access and
+        kept until a generator is added or removed. Don't modify it
         """
-        return dict(zip(self.gens, self.labels))
+        if self._gens_dict_cache is None:
+            self._gens_dict_cache = dict(zip(self.gens, self.labels))
+        return self._gens_dict_cache
 
     @property
     def labels_dict(self):
         """
-        A dictionary mapping labels to generators
+        A dictionary mapping labels to generators, built on first access and
+        kept until a generator is added or removed. Don't modify it
         """
-        return dict(zip(self.labels, self.gens))
+        if self._labels_dict_cache is None:
+            self._labels_dict_cache = dict(zip(self.labels, self.gens))
+        return self._labels_dict_cache
 
-    def start(self):
+    def _clear_dict_caches(self):
+        """
+        Forget `gens_dict` and `labels_dict`, after a generator has been
+        added or removed
+        """
+        self._gens_dict_cache = self._labels_dict_cache = None
+
+    def _drop_front(self):
+        """
+        Remove the current generator and its label
+        """
+        self.gens.popleft()
+        self.labels.popleft()
+        self._clear_dict_caches()
+
+    def _select(self):
+        """
+        Take labeled values from the current generator until it's stopped,
+        paused or exhausted, then move on to the next one
+        """
+        stop = self.stop_condition
+        pause = self.pause_condition
+        as_tuple = self.emit == 'tuple'
+        while self.gens:
+            curr = self.curr = self.gens[0]
+            label = self.labels[0]
+            for res in curr:
+                if stop(res):
+                    self._drop_front()
+                    break
+                if pause(res):
+                    self.gens.rotate(-1)
+                    self.labels.rotate(-1)
+                    break
+                if as_tuple:
+                    yield label, res
+                else:
+                    yield {label: res}
+                # `remove_gen`, `pause_gen` and `stop` all move `.curr` on
+                if self.curr is not curr:
+                    break
+            else:
+                self._drop_front()
+        self.curr = None
+
+    def _select_unpaused(self):
+        """
+        `._select` for selectors without a pause condition
+        """
+        stop = self.stop_condition
+        as_tuple = self.emit == 'tuple'
+        while self.gens:
+            curr = self.curr = self.gens[0]
+            label = self.labels[0]
+            for res in curr:
+                if stop(res):
+                    self._drop_front()
+                    break
+                if as_tuple:
+                    yield label, res
+                else:
+                    yield {label: res}
+                if self.curr is not curr:
+                    break
+            else:
+                self._drop_front()
+        self.curr = None
+
+    def _select_chunked(self):
+        """
+        `._select` that also moves on to the next generator after every
+        `.chunk` labeled values
+        """
+        stop = self.stop_condition
+        pause = self.pause_condition
+        chunk = self.chunk
+        as_tuple = self.emit == 'tuple'
+        while self.gens:
+            curr = self.curr = self.gens[0]
+            label = self.labels[0]
+            taken = 0
+            for res in curr:
+                if stop(res):
+                    self._drop_front()
+                    break
+                if pause(res):
+                    self.gens.rotate(-1)
+                    self.labels.rotate(-1)
+                    break
+                if as_tuple:
+                    yield label, res
+                else:
+                    yield {label: res}
+                if self.curr is not curr:
+                    break
+                taken += 1
+                if taken == chunk:
+                    self.gens.rotate(-1)
+                    self.labels.rotate(-1)
+                    break
+            else:
+                self._drop_front()
+        self.curr = None
+
+    def _chain(self):
+        """
+        Labeled tuples can be built by `zip`, so `itertools.chain` does the
+        work. Labeled dicts are built one at a time, so they can't
+        """
+        if self.emit == 'tuple':
+            return chain.from_iterable(self._fronts())
+        return self._select_unpaused()
+
+    def _fronts(self):
+        """
+        Yield the current generator's values paired with its label, removing
+        it once it's been exhausted
+        """
+        while self.gens:
+            curr = self.curr = self.gens[0]
+            yield zip(repeat(self.labels[0]), curr)
+            if self.gens and self.gens[0] is curr:
+                self._drop_front()
+        self.curr = None
+
+    def pause_gen(self):
         """
-        Start the LabeledSelector
+        Start taking values from the next generator, keeping labels in step
         """
-        gen = super(LabeledSelector, self).start()
-        while True:
-            val = next(gen)
-            label = self.gens_dict[self.curr]
-            yield {label: val}
+        self.labels.rotate(-1)
+        super(LabeledSelector, self).pause_gen()
 
     def remove_gen(self, gen):
         """
-        Remove a generator and its label, and reinitialize self.started
+        Remove a generator and its label
         :param gen: the generator object to remove
         :type gen: a generator object
         """
-        self.labels.remove(self.gens_dict[gen])
+        if self.gens and self.gens[0] is gen:
+            self.labels.popleft()
+        else:
+            self.labels.remove(self.gens_dict[gen])
+        self._clear_dict_caches()
         super(LabeledSelector, self).remove_gen(gen)
 
     # pylint: disable=arguments-differ
@@ -206,15 +555,16 @@ class LabeledSelector(Selector):
         :type label: str
         """
         self.labels.append(label)
+        self._clear_dict_caches()
         super(LabeledSelector, self).add_gen(gen)
 
     def add_gens(self, gen_dict):
         """
-        Add generators from a {'label': <generator>} dict
+        Add generators from a {'label': <generator>} dict, in label order
         :param gen_dict: dict of labeled generators
         :type gen_dict: dict ({'label': <generator>})
         """
-        for label, gen in sorted(gen_dict.iteritems(), key=itemgetter(1)):
+        for label, gen in sorted(gen_dict.items(), key=itemgetter(0)):
             self.add_gen(gen, label)
 
     def select_on(self, label):
@@ -226,8 +576,9 @@ class LabeledSelector(Selector):
         # pylint: disable=missing-docstring
         def gen_wrapper(gen):
             def wrapper(*args, **kwargs):
-                self.add_gen(gen(*args, **kwargs), label)
-                return gen(*args, **kwargs)
+                instance = gen(*args, **kwargs)
+                self.add_gen(instance, label)
+                return instance
             # TODO: doc assignment doesn't seem to be working
             gen_wrapper.__doc__ = gen.__doc__
             gen_wrapper.__name__ = gen.__name__
@@ -239,7 +590,8 @@ class LabeledSelector(Selector):
         Stop the selector by resetting it to an empty state
         """
         super(LabeledSelector, self).stop()
-        self.labels = []
+        self.labels = deque()
+        self._clear_dict_caches()
 
     def __repr__(self):
         """
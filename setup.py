@@ -1,10 +1,16 @@
 """
 Install selector
 """
+import sys
 
 from setuptools import setup
 
 
+PY_MODULES = ['selector']
+if sys.version_info >= (3, 6):
+    # async generators are a syntax error on older interpreters
+    PY_MODULES.append('async_selector')
+
 setup(
         name='selector',
         version='0.1.0',
@@ -13,7 +19,8 @@ setup(
         author='Sam Raker',
         author_email='sam.raker@gmail.com',
         license='WTFPL',
-        py_modules=['selector'],
+        py_modules=PY_MODULES,
         classifiers=['Developemt Status :: 4 - Beta',
-                     'Programming Language :: Python :: 2.7']
+                     'Programming Language :: Python :: 2.7',
+                     'Programming Language :: Python :: 3']
         )
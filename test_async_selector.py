@@ -0,0 +1,203 @@
+"""
+Tests for AsyncSelector
+"""
+import asyncio
+import unittest
+
+from async_selector import AsyncSelector
+
+
+class TestAsyncSelector(unittest.TestCase):
+    """
+    Tests for the AsyncSelector class
+    """
+    def setUp(self):
+        """
+        Set up tests
+        """
+        self.gens = [agen1(), agen2()]
+
+    @staticmethod
+    def run_selector(sel):
+        """
+        Collect every value from an AsyncSelector
+        """
+        async def collect():
+            return [val async for val in sel]
+        return run(collect())
+
+    def test_no_stop(self):
+        """
+        Test AsyncSelector without stop or pause conditions
+        """
+        sel = AsyncSelector(AsyncSelector.false, None, self.gens)
+        expected = sorted(list(range(100)) + list(range(5, 20)))
+        self.assertEqual(expected, sorted(self.run_selector(sel)))
+
+    def test_no_pause(self):
+        """
+        Test AsyncSelector with stop_condition=gt10 and no pause condition
+        """
+        sel = AsyncSelector(gt10, None, self.gens)
+        expected = sorted(list(range(11)) + list(range(5, 11)))
+        self.assertEqual(expected, sorted(self.run_selector(sel)))
+        self.assertEqual(0, len(sel.gens))
+
+    def test_pause(self):
+        """
+        Test AsyncSelector with stop_condition=gt10 and pause_condition=is_even
+        """
+        sel = AsyncSelector(gt10, is_even, self.gens)
+        expected = [1, 3, 5, 5, 7, 7, 9, 9]
+        self.assertEqual(expected, sorted(self.run_selector(sel)))
+
+    def test_not_async(self):
+        """
+        Test that synchronous iterators are rejected when added
+        """
+        self.assertRaises(TypeError, AsyncSelector, AsyncSelector.false,
+                          None, [iter([1, 2])])
+
+    def test_add_gen_running(self):
+        """
+        Test that iterators added while the selector is running are awaited
+        """
+        sel = AsyncSelector(AsyncSelector.false, None, [agen2()])
+
+        async def collect():
+            vals = []
+            async for val in sel:
+                if not vals:
+                    sel.add_gen(agen2())
+                vals.append(val)
+            return vals
+        expected = sorted(list(range(5, 20)) * 2)
+        self.assertEqual(expected, sorted(run(collect())))
+        self.assertEqual(0, len(sel.gens))
+
+    def test_remove_gen_running(self):
+        """
+        Test that iterators removed while the selector is running stop
+        being awaited
+        """
+        fast, other = arange(1000, 1100), arange(0, 100)
+        sel = AsyncSelector(AsyncSelector.false, None, [fast, other])
+
+        async def collect():
+            vals = []
+            async for val in sel:
+                if val == 1000:
+                    sel.remove_gen(fast)
+                vals.append(val)
+            return vals
+        self.assertEqual(list(range(100)) + [1000], sorted(run(collect())))
+        self.assertEqual(0, len(sel.gens))
+
+    def test_stop_running(self):
+        """
+        Test stopping the selector while it's running
+        """
+        sel = AsyncSelector(AsyncSelector.false, None, self.gens)
+
+        async def collect():
+            vals = []
+            async for val in sel:
+                sel.stop()
+                vals.append(val)
+            return vals
+        self.assertEqual(1, len(run(collect())))
+        self.assertEqual(0, len(sel.gens))
+
+    def test_drain(self):
+        """
+        Test AsyncSelector.drain with and without a list to append to
+        """
+        sel = AsyncSelector(gt10, None, self.gens)
+        expected = sorted(list(range(11)) + list(range(5, 11)))
+        self.assertEqual(expected, sorted(run(sel.drain())))
+        out = ['x']
+        sel = AsyncSelector(gt10, None, [agen2()])
+        self.assertIs(out, run(sel.drain(out)))
+        self.assertEqual(['x'] + list(range(5, 11)), out)
+
+    def test_sync_api(self):
+        """
+        Test that the synchronous iteration API raises a clear TypeError
+        """
+        sel = AsyncSelector(AsyncSelector.false, None, self.gens)
+        self.assertRaises(TypeError, list, sel)
+        self.assertRaises(TypeError, iter, sel)
+        self.assertRaises(TypeError, sel.pause_gen)
+        self.assertEqual(self.gens, list(sel.gens))
+
+    def test_overlap(self):
+        """
+        Test that a slow iterator doesn't hold up a fast one
+        """
+        sel = AsyncSelector(AsyncSelector.false, None,
+                            [slow_gen(), agen2()])
+        actual = self.run_selector(sel)
+        self.assertEqual(list(range(5, 20)), actual[:15])
+        self.assertEqual('slow', actual[-1])
+
+
+def run(coro):
+    """
+    Run a coroutine to completion on a new event loop. Stands in for
+    `asyncio.run`, which is Python 3.7+
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+async def arange(start, stop):
+    """
+    Asynchronous generator yielding values between `start` and `stop - 1`
+    """
+    for i in range(start, stop):
+        await asyncio.sleep(0)
+        yield i
+
+
+async def agen1():
+    """
+    Asynchronous generator yielding values between 0 and 99
+    """
+    for i in range(100):
+        await asyncio.sleep(0)
+        yield i
+
+
+async def agen2():
+    """
+    Asynchronous generator yielding values between 5 and 19
+    """
+    for i in range(5, 20):
+        await asyncio.sleep(0)
+        yield i
+
+
+async def slow_gen():
+    """
+    Asynchronous generator yielding a single value after a delay
+    """
+    await asyncio.sleep(0.1)
+    yield 'slow'
+
+
+def gt10(val):
+    """
+    Predicate testing if a value is greater than 10
+    """
+    return val > 10
+
+
+def is_even(val):
+    """
+    Predicate testing if a value is even
+    """
+    return val % 2 == 0
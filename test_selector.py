@@ -2,6 +2,8 @@
 Tests for Selector and LabeledSelector
 """
 import unittest
+import weakref
+from collections import deque
 
 from selector import Selector, LabeledSelector
 
@@ -24,6 +26,48 @@ class TestSelector(unittest.TestCase):
         expected = list(gen1()) + list(gen2())
         self.assertEqual(expected, list(sel))
 
+    def test_iterator_class(self):
+        """
+        Test Selector without conditions over hand-written iterators
+        """
+        sel = Selector(Selector.false, None, [Counter(3), Counter(4)])
+        self.assertEqual([1, 2, 3, 1, 2, 3, 4], list(sel))
+
+    def test_not_iterator(self):
+        """
+        Test that iterables which aren't iterators are rejected when added,
+        rather than starting over every time they're paused
+        """
+        self.assertRaises(TypeError, Selector, gt10, is_even, [[1, 2, 3]])
+        sel = Selector(gt10, is_even)
+        self.assertRaises(TypeError, sel.add_gen, range(3))
+        self.assertRaises(TypeError, LabeledSelector, gt10, is_even,
+                          {'gen1': (1, 2, 3)})
+        sel.add_gen(iter([1, 2, 3]))
+        self.assertEqual([1, 3], list(sel))
+
+    def test_iterator_class_loops(self):
+        """
+        Test Selector's selection loops over hand-written iterators
+        """
+        sel = Selector(Selector.false, is_even, [Counter(3), Counter(4)])
+        self.assertEqual([1, 1, 3, 3], list(sel))
+        sel = Selector(lambda x: x > 2, None, [Counter(3), Counter(4)])
+        self.assertEqual([1, 2, 1, 2], list(sel))
+        sel = Selector(Selector.false, None, [Counter(3), Counter(4)],
+                       chunk=2)
+        self.assertEqual([1, 2, 1, 2, 3, 3, 4], list(sel))
+
+    def test_next_only(self):
+        """
+        Test that objects with only a `next` method are rejected when added
+        """
+        self.assertRaises(TypeError, Selector, Selector.false, None,
+                          [NextOnly()])
+        sel = Selector(Selector.false)
+        self.assertRaises(TypeError, sel.add_gen, NextOnly())
+        self.assertEqual(0, len(sel.gens))
+
     def test_no_pause(self):
         """
         Test Selector with stop_condition=gt10 and no pause condition
@@ -40,24 +84,202 @@ class TestSelector(unittest.TestCase):
         expected = [5, 1, 7, 3, 9, 5, 7, 9]
         self.assertEqual(expected, list(sel))
 
+    def test_pause_no_stop(self):
+        """
+        Test Selector with pause_condition=is_even and no stop condition
+        """
+        gens = [iter([1, 2, 3]), iter([5, 7, 8, 9])]
+        sel = Selector(Selector.false, is_even, gens)
+        self.assertEqual([1, 5, 7, 3, 9], list(sel))
+
+    def test_drain(self):
+        """
+        Test .drain() collecting the same values as iterating
+        """
+        sel = Selector(gt10, is_even, self.gens)
+        self.assertEqual([5, 1, 7, 3, 9, 5, 7, 9], sel.drain())
+        self.assertEqual(0, len(sel.gens))
+        self.assertIsNone(sel.curr)
+
+    def test_drain_into(self):
+        """
+        Test .drain() appending to an existing list
+        """
+        sel = Selector(Selector.false, None, self.gens)
+        out = ['start']
+        self.assertIs(out, sel.drain(out))
+        self.assertEqual(['start'] + list(gen1()) + list(gen2()), out)
+
+    def test_remove_rotation(self):
+        """
+        Test that removing a generator moves on to the one after it
+        """
+        gens = [iter([1, 2, 3]), iter([5, 30]), iter([7, 8, 9])]
+        sel = Selector(gt10, is_even, gens)
+        self.assertEqual([1, 5, 7, 3, 9], list(sel))
+
+    def test_remove_gen(self):
+        """
+        Test removing a generator that isn't the current one
+        """
+        gens = [iter([1, 2, 3]), iter([5, 30]), iter([7, 8, 9])]
+        sel = Selector(gt10, is_even, gens)
+        sel.remove_gen(gens[1])
+        self.assertEqual([1, 7, 3, 9], list(sel))
+        self.assertIsNone(sel.curr)
+
+    def test_remove_curr_mid_run(self):
+        """
+        Test removing the current generator while iterating
+        """
+        expected = [0, 1] + list(range(100, 105)) + list(range(200, 205))
+        for kwargs in MID_RUN_OPTIONS:
+            sel = Selector(gt1000, gens=three_gens(), **kwargs)
+            self.assertEqual(expected,
+                             call_at(sel, 1, lambda s: s.remove_gen(s.curr)))
+            self.assertEqual(0, len(sel.gens))
+
+    def test_pause_gen_mid_run(self):
+        """
+        Test pausing the current generator while iterating
+        """
+        expected = ([0, 1] + list(range(100, 105)) + list(range(200, 205)) +
+                    [2, 3, 4])
+        for kwargs in MID_RUN_OPTIONS:
+            sel = Selector(gt1000, gens=three_gens(), **kwargs)
+            self.assertEqual(expected, call_at(sel, 1, Selector.pause_gen))
+
+    def test_stop_mid_run(self):
+        """
+        Test stopping the selector while iterating
+        """
+        for kwargs in MID_RUN_OPTIONS:
+            sel = Selector(gt1000, gens=three_gens(), **kwargs)
+            self.assertEqual([0, 1], call_at(sel, 1, Selector.stop))
+            self.assertIsNone(sel.curr)
+
+    def test_remove_curr_chain(self):
+        """
+        Test that removing the current generator of a selector without
+        conditions doesn't drop the next one
+        """
+        sel = Selector(Selector.false, gens=three_gens())
+        expected = (list(range(5)) + list(range(100, 105)) +
+                    list(range(200, 205)))
+        self.assertEqual(expected,
+                         call_at(sel, 1, lambda s: s.remove_gen(s.curr)))
+
+    def test_getitem(self):
+        """
+        Test indexing and slicing a Selector's generators
+        """
+        gens = [gen1(), gen2(), gen1()]
+        sel = Selector(gt10, is_even, gens)
+        self.assertIs(gens[1], sel[1])
+        self.assertIs(gens[-1], sel[-1])
+        self.assertEqual(gens[0:2], sel[0:2])
+        self.assertEqual(gens[::-1], sel[::-1])
+
+    def test_chunk(self):
+        """
+        Test Selector moving on after every `chunk` values
+        """
+        gens = [iter([1, 2, 3]), iter([4, 5, 6, 7, 8])]
+        sel = Selector(gt10, None, gens, chunk=2)
+        self.assertEqual([1, 2, 4, 5, 3, 6, 7, 8], list(sel))
+
+    def test_chunk_pause(self):
+        """
+        Test Selector with both a chunk size and a pause condition
+        """
+        sel = Selector(gt10, is_even, self.gens, chunk=2)
+        expected = [5, 1, 7, 3, 9, 5, 7, 9]
+        self.assertEqual(expected, list(sel))
+
+    def test_chunk_invalid(self):
+        """
+        Test that a chunk size that isn't a positive int raises ValueError
+        """
+        for chunk in (0, -1, True, 1.5, '2'):
+            self.assertRaises(ValueError, Selector, gt10, None, self.gens,
+                              chunk=chunk)
+            self.assertRaises(ValueError, LabeledSelector, gt10, None,
+                              chunk=chunk)
+
+    def test_memoize(self):
+        """
+        Test that memoized conditions are called once per distinct value
+        """
+        seen = []
+
+        def counting_gt10(val):
+            seen.append(val)
+            return gt10(val)
+        gens = [iter([1, 1, 2, 11]), iter([2, 1, 2])]
+        sel = Selector(counting_gt10, None, gens, memoize=True)
+        self.assertEqual([1, 1, 2, 2, 1, 2], list(sel))
+        self.assertEqual([1, 2, 11], seen)
+
+    def test_memoized(self):
+        """
+        Test Selector.memoized directly, whichever cache backs it
+        """
+        seen = []
+
+        def counting_is_even(val):
+            seen.append(val)
+            return is_even(val)
+        pred = Selector.memoized(counting_is_even)
+        self.assertEqual([False, True, False, True],
+                         [pred(val) for val in [1, 2, 1, 2]])
+        self.assertEqual([1, 2], seen)
+        self.assertIs(Selector.false, Selector.memoized(Selector.false))
+
+    def test_memoize_typed(self):
+        """
+        Test that memoized conditions tell equal values of different types
+        apart
+        """
+        def is_bool(val):
+            return isinstance(val, bool)
+        sel = Selector(is_bool, None, [iter([1, 1.0, True, 2])],
+                       memoize=True)
+        self.assertEqual([1, 1.0], list(sel))
+
+    def test_memoize_false(self):
+        """
+        Test that memoizing leaves `Selector.false` alone
+        """
+        sel = Selector(gt10, None, self.gens, memoize=True)
+        self.assertIs(Selector.false, sel.pause_condition)
+
     def test_stop(self):
         """
         Test .stop()
         """
         sel = Selector(gt10, is_even, self.gens)
         sel.stop()
-        self.assertEqual([], sel.gens)
-        self.assertIsNone(sel.started)
+        self.assertEqual(deque(), sel.gens)
         self.assertIsNone(sel.curr)
 
+    def test_weakref(self):
+        """
+        Test that selectors can be weakly referenced
+        """
+        sel = Selector(gt10, None, self.gens)
+        self.assertIs(sel, weakref.ref(sel)())
+        labeled = LabeledSelector(gt10)
+        self.assertIs(labeled, weakref.ref(labeled)())
+
     def test_select_on(self):
         """
         Test .select_on decorator
         """
         sel = Selector(gt10)
-        sel.select_on(gen1)
+        decorated = sel.select_on(gen1)
         self.assertEqual(1, len(sel.gens))
         sel_gen = sel.gens[0]
+        self.assertIs(decorated, sel_gen)
         #self.assertEqual(gen1.__doc__, sel_gen.__doc__)
         self.assertEqual(gen1.__name__, sel_gen.__name__)
 
@@ -79,14 +301,14 @@ class TestLabeledSelector(unittest.TestCase):
         This function is necessary because LabeledSelector results are
         unordered with respect to source generators.
         """
-        return sorted(list(sel), key=lambda x: x.keys())
+        return sorted(list(sel), key=lambda x: list(x.keys()))
 
     def test_gens_dict(self):
         """
         Test .gens_dict property
         """
         sel = LabeledSelector(gt10, None, self.labels_dict)
-        expected = {val: key for key, val in self.labels_dict.iteritems()}
+        expected = {val: key for key, val in self.labels_dict.items()}
         self.assertEqual(expected, sel.gens_dict)
 
     def test_labels_dict(self):
@@ -96,13 +318,30 @@ class TestLabeledSelector(unittest.TestCase):
         sel = LabeledSelector(gt10, None, self.labels_dict)
         self.assertEqual(self.labels_dict, sel.labels_dict)
 
+    def test_dict_cache(self):
+        """
+        Test that .gens_dict and .labels_dict are rebuilt only after the
+        generators change
+        """
+        sel = LabeledSelector(gt10, None, self.labels_dict)
+        labels_dict = sel.labels_dict
+        self.assertIs(labels_dict, sel.labels_dict)
+        sel.add_gen(gen1(), 'gen3')
+        self.assertEqual(['gen1', 'gen2', 'gen3'],
+                         sorted(sel.labels_dict.keys()))
+        it = iter(sel)
+        for _ in range(12):
+            next(it)
+        self.assertEqual(['gen2', 'gen3'], sorted(sel.labels_dict.keys()))
+        self.assertEqual(['gen2', 'gen3'], sorted(sel.gens_dict.values()))
+
     def test_no_stop(self):
         """
         Test LabeledSelector without pause or stop conditions
         """
         sel = LabeledSelector(LabeledSelector.false, None, self.labels_dict)
-        expected = [{'gen1': val} for val in xrange(100)]
-        expected += [{'gen2': val} for val in xrange(5, 20)]
+        expected = [{'gen1': val} for val in range(100)]
+        expected += [{'gen2': val} for val in range(5, 20)]
         actual = self.sort_results(sel)
         self.assertEqual(expected, actual)
 
@@ -111,8 +350,8 @@ class TestLabeledSelector(unittest.TestCase):
         Test LabeledSelector with stop_condition=gt10 and no pause condition
         """
         sel = LabeledSelector(gt10, None, self.labels_dict)
-        expected = [{'gen1': val} for val in xrange(11)]
-        expected += [{'gen2': val} for val in xrange(5, 11)]
+        expected = [{'gen1': val} for val in range(11)]
+        expected += [{'gen2': val} for val in range(5, 11)]
         actual = self.sort_results(sel)
         self.assertEqual(expected, actual)
 
@@ -126,15 +365,117 @@ class TestLabeledSelector(unittest.TestCase):
                     {'gen2': 9}, {'gen1': 5}, {'gen1': 7}, {'gen1': 9}]
         self.assertEqual(expected, list(sel))
 
+    def test_chunk(self):
+        """
+        Test LabeledSelector moving on after every `chunk` values
+        """
+        sel = LabeledSelector(gt10, None, self.labels_dict, chunk=3)
+        expected = [{'gen1': 0}, {'gen1': 1}, {'gen1': 2},
+                    {'gen2': 5}, {'gen2': 6}, {'gen2': 7},
+                    {'gen1': 3}, {'gen1': 4}, {'gen1': 5},
+                    {'gen2': 8}, {'gen2': 9}, {'gen2': 10},
+                    {'gen1': 6}, {'gen1': 7}, {'gen1': 8},
+                    {'gen1': 9}, {'gen1': 10}]
+        self.assertEqual(expected, list(sel))
+
+    def test_remove_gen(self):
+        """
+        Test that removing a generator removes its label along with it
+        """
+        sel = LabeledSelector(gt10, is_even, self.labels_dict)
+        sel.remove_gen(self.labels_dict['gen2'])
+        self.assertEqual(deque(['gen1']), sel.labels)
+        self.assertEqual([{'gen1': val} for val in (1, 3, 5, 7, 9)],
+                         list(sel))
+
+    def test_remove_curr_mid_run(self):
+        """
+        Test removing the current generator and its label while iterating
+        """
+        expected = ([('a', 0), ('a', 1)] +
+                    [('b', val) for val in range(100, 105)] +
+                    [('c', val) for val in range(200, 205)])
+        for kwargs in MID_RUN_OPTIONS:
+            sel = LabeledSelector(gt1000, gen_dict=three_gens_dict(),
+                                  emit='tuple', **kwargs)
+            self.assertEqual(expected, call_at(sel, ('a', 1),
+                                               lambda s: s.remove_gen(s.curr)))
+            self.assertEqual(deque(), sel.labels)
+            self.assertEqual({}, sel.labels_dict)
+
+    def test_pause_gen_mid_run(self):
+        """
+        Test pausing the current generator while iterating
+        """
+        expected = ([{'a': 0}, {'a': 1}] +
+                    [{'b': val} for val in range(100, 105)] +
+                    [{'c': val} for val in range(200, 205)] +
+                    [{'a': 2}, {'a': 3}, {'a': 4}])
+        for kwargs in MID_RUN_OPTIONS:
+            sel = LabeledSelector(gt1000, gen_dict=three_gens_dict(),
+                                  **kwargs)
+            self.assertEqual(expected, call_at(sel, {'a': 1},
+                                               LabeledSelector.pause_gen))
+
+    def test_stop_mid_run(self):
+        """
+        Test stopping the selector while iterating
+        """
+        for kwargs in MID_RUN_OPTIONS:
+            sel = LabeledSelector(gt1000, gen_dict=three_gens_dict(),
+                                  emit='tuple', **kwargs)
+            self.assertEqual([('a', 0), ('a', 1)],
+                             call_at(sel, ('a', 1), LabeledSelector.stop))
+            self.assertEqual(deque(), sel.labels)
+
+    def test_emit_tuple(self):
+        """
+        Test LabeledSelector yielding (label, value) tuples
+        """
+        sel = LabeledSelector(gt10, is_even, self.labels_dict, emit='tuple')
+        expected = [('gen2', 5), ('gen1', 1), ('gen2', 7), ('gen1', 3),
+                    ('gen2', 9), ('gen1', 5), ('gen1', 7), ('gen1', 9)]
+        self.assertEqual(expected, list(sel))
+
+    def test_emit_tuple_no_stop(self):
+        """
+        Test LabeledSelector yielding tuples without pause or stop conditions
+        """
+        sel = LabeledSelector(LabeledSelector.false, None, self.labels_dict,
+                              emit='tuple')
+        expected = [('gen1', val) for val in range(100)]
+        expected += [('gen2', val) for val in range(5, 20)]
+        self.assertEqual(expected, list(sel))
+        self.assertEqual(deque(), sel.labels)
+
+    def test_drain(self):
+        """
+        Test .drain() with both output formats
+        """
+        sel = LabeledSelector(gt10, is_even, self.labels_dict)
+        expected = [{'gen2': 5}, {'gen1': 1}, {'gen2': 7}, {'gen1': 3},
+                    {'gen2': 9}, {'gen1': 5}, {'gen1': 7}, {'gen1': 9}]
+        self.assertEqual(expected, sel.drain())
+        sel = LabeledSelector(gt10, is_even, {'gen1': gen1(), 'gen2': gen2()},
+                              emit='tuple')
+        self.assertEqual([list(val.items())[0] for val in expected],
+                         sel.drain())
+
+    def test_emit_invalid(self):
+        """
+        Test that LabeledSelector rejects unknown output formats
+        """
+        self.assertRaises(ValueError, LabeledSelector, gt10, None, None,
+                          emit='list')
+
     def test_stop(self):
         """
         Test .stop()
         """
         sel = LabeledSelector(gt10, is_even, self.labels_dict)
         sel.stop()
-        self.assertEqual([], sel.gens)
-        self.assertEqual([], sel.labels)
-        self.assertIsNone(sel.started)
+        self.assertEqual(deque(), sel.gens)
+        self.assertEqual(deque(), sel.labels)
         self.assertIsNone(sel.curr)
 
     def test_select_on(self):
@@ -142,13 +483,45 @@ class TestLabeledSelector(unittest.TestCase):
         Test .select_on decorator
         """
         sel = LabeledSelector(gt10)
-        sel.select_on('gen1')(gen1)
+        decorated = sel.select_on('gen1')(gen1)
         self.assertEqual(1, len(sel.gens))
         sel_gen = sel['gen1']
+        self.assertIs(decorated, sel_gen)
         #self.assertEqual(gen1.__doc__, sel_gen.__doc__)
         self.assertEqual(gen1.__name__, sel_gen.__name__)
 
 
+class Counter(object):
+    """
+    Hand-written iterator counting from 1 up to `limit`
+    """
+    def __init__(self, limit):
+        self.limit = limit
+        self.count = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.count >= self.limit:
+            raise StopIteration
+        self.count += 1
+        return self.count
+
+    next = __next__
+
+
+class NextOnly(object):
+    """
+    Object with a `next` method that doesn't implement `__iter__`
+    """
+    # pylint: disable=no-self-use
+    def next(self):
+        raise StopIteration
+
+    __next__ = next
+
+
 def gen1():
     """
     Generator yielding values between 0 and 99
@@ -181,3 +554,48 @@ def is_even(val):
     Predicate testing if a value is even
     """
     return val % 2 == 0
+
+
+def is_negative(val):
+    """
+    Predicate testing if a value is less than 0
+    """
+    return val < 0
+
+
+def gt1000(val):
+    """
+    Predicate testing if a value is greater than 1000
+    """
+    return val > 1000
+
+
+# the stop-only, paused and chunked selection loops
+MID_RUN_OPTIONS = [{}, {'pause_condition': is_negative}, {'chunk': 100}]
+
+
+def three_gens():
+    """
+    Generators over [0, 5), [100, 105) and [200, 205)
+    """
+    return [iter(range(start, start + 5)) for start in (0, 100, 200)]
+
+
+def three_gens_dict():
+    """
+    `three_gens`, labeled 'a', 'b' and 'c'
+    """
+    return dict(zip('abc', three_gens()))
+
+
+def call_at(sel, at, method):
+    """
+    Collect every value from a selector, calling `method` on it right after
+    it yields `at`
+    """
+    vals = []
+    for val in sel:
+        vals.append(val)
+        if val == at:
+            method(sel)
+    return vals